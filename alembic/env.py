@@ -35,6 +35,17 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def include_name(name, type_, parent_names):
+    """
+    Full-text search objects (SQLite FTS5 tables, PostgreSQL GIN indexes)
+    are created with raw SQL in their migration; keep autogenerate away from them.
+    """
+    if type_ in ("table", "index"):
+        return "_fts" not in name
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -59,6 +70,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
         render_as_batch=True,  # Required for SQLite to handle schema changes safely - Manage AlTER command for SQlITE
     )
 
@@ -81,7 +93,10 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata, render_as_batch=True
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            render_as_batch=True,
         )
 
         with context.begin_transaction():
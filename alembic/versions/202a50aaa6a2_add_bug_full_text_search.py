@@ -0,0 +1,109 @@
+"""add bug full text search
+
+Revision ID: 202a50aaa6a2
+Revises: 3f012360abed
+Create Date: 2026-10-14 19:21:11.768650
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '202a50aaa6a2'
+down_revision: Union[str, Sequence[str], None] = '3f012360abed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite: external-content FTS5 tables kept in sync by triggers
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE bugs_fts USING fts5("
+    "title, description, content='bugs', content_rowid='id')",
+    """CREATE TRIGGER bugs_fts_ai AFTER INSERT ON bugs BEGIN
+        INSERT INTO bugs_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER bugs_fts_ad AFTER DELETE ON bugs BEGIN
+        INSERT INTO bugs_fts(bugs_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER bugs_fts_au AFTER UPDATE OF title, description ON bugs BEGIN
+        INSERT INTO bugs_fts(bugs_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO bugs_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    "INSERT INTO bugs_fts(bugs_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE bug_activities_fts USING fts5("
+    "content, content='bug_activities', content_rowid='id')",
+    """CREATE TRIGGER bug_activities_fts_ai AFTER INSERT ON bug_activities BEGIN
+        INSERT INTO bug_activities_fts(rowid, content)
+        VALUES (new.id, new.content);
+    END""",
+    """CREATE TRIGGER bug_activities_fts_ad AFTER DELETE ON bug_activities BEGIN
+        INSERT INTO bug_activities_fts(bug_activities_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+    END""",
+    """CREATE TRIGGER bug_activities_fts_au AFTER UPDATE OF content ON bug_activities BEGIN
+        INSERT INTO bug_activities_fts(bug_activities_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+        INSERT INTO bug_activities_fts(rowid, content)
+        VALUES (new.id, new.content);
+    END""",
+    "INSERT INTO bug_activities_fts(bug_activities_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS bug_activities_fts_au",
+    "DROP TRIGGER IF EXISTS bug_activities_fts_ad",
+    "DROP TRIGGER IF EXISTS bug_activities_fts_ai",
+    "DROP TABLE IF EXISTS bug_activities_fts",
+    "DROP TRIGGER IF EXISTS bugs_fts_au",
+    "DROP TRIGGER IF EXISTS bugs_fts_ad",
+    "DROP TRIGGER IF EXISTS bugs_fts_ai",
+    "DROP TABLE IF EXISTS bugs_fts",
+]
+
+# PostgreSQL: GIN expression indexes (must match the expressions in routers/bugs.py)
+POSTGRESQL_UPGRADE = [
+    "CREATE INDEX ix_bugs_fts ON bugs USING gin ("
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, '')))",
+    "CREATE INDEX ix_bug_activities_fts ON bug_activities USING gin ("
+    "to_tsvector('english', coalesce(content, '')))",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_bug_activities_fts",
+    "DROP INDEX IF EXISTS ix_bugs_fts",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_UPGRADE
+    elif dialect == "postgresql":
+        statements = POSTGRESQL_UPGRADE
+    else:
+        statements = []
+
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_DOWNGRADE
+    elif dialect == "postgresql":
+        statements = POSTGRESQL_DOWNGRADE
+    else:
+        statements = []
+
+    for statement in statements:
+        op.execute(statement)
@@ -0,0 +1,113 @@
+"""add task status_is_final
+
+Revision ID: 2d250bca020f
+Revises: d4c00f297ae2
+Create Date: 2026-10-14 19:31:07.929371
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d250bca020f'
+down_revision: Union[str, Sequence[str], None] = 'd4c00f297ae2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keeps tasks.status_is_final equal to the is_final flag of the task's status.
+# The sync only fires when the value really changes: seed_data() upserts every
+# status on startup, which must not rewrite every task row.
+SQLITE_UPGRADE = [
+    """CREATE TRIGGER tasks_status_is_final_ai AFTER INSERT ON tasks BEGIN
+        UPDATE tasks SET status_is_final = coalesce(
+            (SELECT is_final FROM task_statuses WHERE id = new.status_id), 0
+        ) WHERE id = new.id;
+    END""",
+    """CREATE TRIGGER tasks_status_is_final_au AFTER UPDATE OF status_id ON tasks
+    WHEN old.status_id IS NOT new.status_id BEGIN
+        UPDATE tasks SET status_is_final = coalesce(
+            (SELECT is_final FROM task_statuses WHERE id = new.status_id), 0
+        ) WHERE id = new.id;
+    END""",
+    """CREATE TRIGGER task_statuses_is_final_au AFTER UPDATE OF is_final ON task_statuses
+    WHEN old.is_final IS NOT new.is_final BEGIN
+        UPDATE tasks SET status_is_final = coalesce(new.is_final, 0)
+        WHERE status_id = new.id;
+    END""",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS task_statuses_is_final_au",
+    "DROP TRIGGER IF EXISTS tasks_status_is_final_au",
+    "DROP TRIGGER IF EXISTS tasks_status_is_final_ai",
+]
+
+POSTGRESQL_UPGRADE = [
+    """CREATE FUNCTION tasks_set_status_is_final() RETURNS trigger AS $$
+    BEGIN
+        NEW.status_is_final := coalesce(
+            (SELECT is_final FROM task_statuses WHERE id = NEW.status_id), false
+        );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql""",
+    "CREATE TRIGGER tasks_status_is_final BEFORE INSERT OR UPDATE OF status_id "
+    "ON tasks FOR EACH ROW EXECUTE FUNCTION tasks_set_status_is_final()",
+    """CREATE FUNCTION task_statuses_sync_is_final() RETURNS trigger AS $$
+    BEGIN
+        UPDATE tasks SET status_is_final = coalesce(NEW.is_final, false)
+        WHERE status_id = NEW.id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql""",
+    "CREATE TRIGGER task_statuses_is_final AFTER UPDATE OF is_final "
+    "ON task_statuses FOR EACH ROW WHEN (OLD.is_final IS DISTINCT FROM NEW.is_final) "
+    "EXECUTE FUNCTION task_statuses_sync_is_final()",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS task_statuses_is_final ON task_statuses",
+    "DROP FUNCTION IF EXISTS task_statuses_sync_is_final()",
+    "DROP TRIGGER IF EXISTS tasks_status_is_final ON tasks",
+    "DROP FUNCTION IF EXISTS tasks_set_status_is_final()",
+]
+
+
+def _trigger_statements(sqlite, postgresql):
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite
+    elif dialect == "postgresql":
+        return postgresql
+    return []
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Plain ALTER TABLE instead of batch mode: a batch table rebuild on
+    # SQLite would silently drop the tasks_fts triggers.
+    op.add_column('tasks', sa.Column('status_is_final', sa.Boolean(), server_default=sa.false(), nullable=False))
+    # Must stay identical to the list's ORDER BY (app.models.task.deadline_sort_key)
+    op.create_index('ix_tasks_status_is_final_deadline', 'tasks', ['status_is_final', sa.text("coalesce(deadline, '9999-12-31 00:00:00+00:00')"), 'created_at', 'id'], unique=False)
+
+    # Backfill existing rows, then let the triggers keep it current
+    op.execute(
+        "UPDATE tasks SET status_is_final = coalesce("
+        "(SELECT is_final FROM task_statuses WHERE task_statuses.id = tasks.status_id), "
+        "false)"
+    )
+    for statement in _trigger_statements(SQLITE_UPGRADE, POSTGRESQL_UPGRADE):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in _trigger_statements(SQLITE_DOWNGRADE, POSTGRESQL_DOWNGRADE):
+        op.execute(statement)
+
+    op.drop_index('ix_tasks_status_is_final_deadline', table_name='tasks')
+    op.drop_column('tasks', 'status_is_final')
@@ -0,0 +1,109 @@
+"""add task full text search
+
+Revision ID: 4b80e462df46
+Revises: 202a50aaa6a2
+Create Date: 2026-10-14 19:24:11.491516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b80e462df46'
+down_revision: Union[str, Sequence[str], None] = '202a50aaa6a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite: external-content FTS5 tables kept in sync by triggers
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id')",
+    """CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE task_activities_fts USING fts5("
+    "content, content='task_activities', content_rowid='id')",
+    """CREATE TRIGGER task_activities_fts_ai AFTER INSERT ON task_activities BEGIN
+        INSERT INTO task_activities_fts(rowid, content)
+        VALUES (new.id, new.content);
+    END""",
+    """CREATE TRIGGER task_activities_fts_ad AFTER DELETE ON task_activities BEGIN
+        INSERT INTO task_activities_fts(task_activities_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+    END""",
+    """CREATE TRIGGER task_activities_fts_au AFTER UPDATE OF content ON task_activities BEGIN
+        INSERT INTO task_activities_fts(task_activities_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+        INSERT INTO task_activities_fts(rowid, content)
+        VALUES (new.id, new.content);
+    END""",
+    "INSERT INTO task_activities_fts(task_activities_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS task_activities_fts_au",
+    "DROP TRIGGER IF EXISTS task_activities_fts_ad",
+    "DROP TRIGGER IF EXISTS task_activities_fts_ai",
+    "DROP TABLE IF EXISTS task_activities_fts",
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    "DROP TRIGGER IF EXISTS tasks_fts_ad",
+    "DROP TRIGGER IF EXISTS tasks_fts_ai",
+    "DROP TABLE IF EXISTS tasks_fts",
+]
+
+# PostgreSQL: GIN expression indexes (must match the expressions in routers/tasks.py)
+POSTGRESQL_UPGRADE = [
+    "CREATE INDEX ix_tasks_fts ON tasks USING gin ("
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, '')))",
+    "CREATE INDEX ix_task_activities_fts ON task_activities USING gin ("
+    "to_tsvector('english', coalesce(content, '')))",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_task_activities_fts",
+    "DROP INDEX IF EXISTS ix_tasks_fts",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_UPGRADE
+    elif dialect == "postgresql":
+        statements = POSTGRESQL_UPGRADE
+    else:
+        statements = []
+
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_DOWNGRADE
+    elif dialect == "postgresql":
+        statements = POSTGRESQL_DOWNGRADE
+    else:
+        statements = []
+
+    for statement in statements:
+        op.execute(statement)
@@ -0,0 +1,118 @@
+"""add task status counts
+
+Revision ID: a23c3ed59a36
+Revises: 2d250bca020f
+Create Date: 2026-10-14 19:35:15.908326
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a23c3ed59a36'
+down_revision: Union[str, Sequence[str], None] = '2d250bca020f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keeps task_status_counts equal to SELECT status_id, count(*) FROM tasks
+SQLITE_UPGRADE = [
+    """CREATE TRIGGER task_status_counts_ai AFTER INSERT ON tasks
+    WHEN new.status_id IS NOT NULL BEGIN
+        INSERT INTO task_status_counts (status_id, task_count) VALUES (new.status_id, 1)
+        ON CONFLICT (status_id) DO UPDATE SET task_count = task_count + 1;
+    END""",
+    """CREATE TRIGGER task_status_counts_ad AFTER DELETE ON tasks
+    WHEN old.status_id IS NOT NULL BEGIN
+        UPDATE task_status_counts SET task_count = task_count - 1
+        WHERE status_id = old.status_id;
+    END""",
+    """CREATE TRIGGER task_status_counts_au AFTER UPDATE OF status_id ON tasks
+    WHEN old.status_id IS NOT new.status_id BEGIN
+        UPDATE task_status_counts SET task_count = task_count - 1
+        WHERE status_id = old.status_id;
+        INSERT INTO task_status_counts (status_id, task_count)
+        SELECT new.status_id, 1 WHERE new.status_id IS NOT NULL
+        ON CONFLICT (status_id) DO UPDATE SET task_count = task_count + 1;
+    END""",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS task_status_counts_au",
+    "DROP TRIGGER IF EXISTS task_status_counts_ad",
+    "DROP TRIGGER IF EXISTS task_status_counts_ai",
+]
+
+POSTGRESQL_UPGRADE = [
+    """CREATE FUNCTION task_status_counts_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND OLD.status_id IS NOT DISTINCT FROM NEW.status_id THEN
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE task_status_counts SET task_count = task_count - 1
+            WHERE status_id = OLD.status_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            IF NEW.status_id IS NOT NULL THEN
+                INSERT INTO task_status_counts (status_id, task_count)
+                VALUES (NEW.status_id, 1)
+                ON CONFLICT (status_id)
+                DO UPDATE SET task_count = task_status_counts.task_count + 1;
+            END IF;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql""",
+    "CREATE TRIGGER task_status_counts_sync "
+    "AFTER INSERT OR DELETE OR UPDATE OF status_id ON tasks "
+    "FOR EACH ROW EXECUTE FUNCTION task_status_counts_sync()",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS task_status_counts_sync ON tasks",
+    "DROP FUNCTION IF EXISTS task_status_counts_sync()",
+]
+
+
+def _trigger_statements(sqlite, postgresql):
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite
+    elif dialect == "postgresql":
+        return postgresql
+    return []
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('task_status_counts',
+    sa.Column('status_id', sa.Integer(), nullable=False),
+    sa.Column('task_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['status_id'], ['task_statuses.id'], ),
+    sa.PrimaryKeyConstraint('status_id')
+    )
+    # ### end Alembic commands ###
+
+    # Backfill from the current rows, then let the triggers keep it current
+    op.execute(
+        "INSERT INTO task_status_counts (status_id, task_count) "
+        "SELECT status_id, count(*) FROM tasks "
+        "WHERE status_id IS NOT NULL GROUP BY status_id"
+    )
+    for statement in _trigger_statements(SQLITE_UPGRADE, POSTGRESQL_UPGRADE):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in _trigger_statements(SQLITE_DOWNGRADE, POSTGRESQL_DOWNGRADE):
+        op.execute(statement)
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_table('task_status_counts')
+    # ### end Alembic commands ###
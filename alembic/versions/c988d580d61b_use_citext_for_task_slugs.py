@@ -0,0 +1,49 @@
+"""use citext for task slugs
+
+Revision ID: c988d580d61b
+Revises: 4b80e462df46
+Create Date: 2026-10-14 19:28:31.405907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c988d580d61b'
+down_revision: Union[str, Sequence[str], None] = '4b80e462df46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL only: SQLite keeps the plain TEXT column
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.alter_column(
+        "tasks",
+        "slug",
+        existing_type=sa.String(),
+        type_=postgresql.CITEXT(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "tasks",
+        "slug",
+        existing_type=postgresql.CITEXT(),
+        type_=sa.String(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,53 @@
+import time
+from dataclasses import dataclass
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass(frozen=True)
+class StatusEntry:
+    """Read-only, session-independent copy of a BugStatus / TaskStatus row."""
+
+    id: int
+    name: str
+    slug: str
+    color: str
+    is_final: bool
+    count: int = 0
+
+
+# Status tables are tiny and only change when seed_data runs, so each
+# process keeps one copy per table until invalidate_status_catalog() is called.
+# The TTL bounds how long a change made by another process can go unseen.
+CATALOG_TTL_SECONDS = 60
+
+_catalogs: dict[str, tuple[float, tuple[StatusEntry, ...]]] = {}
+
+
+async def get_status_catalog(db: AsyncSession, status_model) -> tuple[StatusEntry, ...]:
+    """Returns all rows of `status_model` ordered by id, cached per process."""
+    key = status_model.__tablename__
+    now = time.monotonic()
+    loaded_at, catalog = _catalogs.get(key, (0.0, None))
+
+    if catalog is None or now - loaded_at > CATALOG_TTL_SECONDS:
+        result = await db.execute(select(status_model).order_by(status_model.id))
+        rows = result.scalars().all()
+        catalog = tuple(
+            StatusEntry(
+                id=s.id,
+                name=s.name,
+                slug=s.slug,
+                color=s.color,
+                is_final=s.is_final,
+            )
+            for s in rows
+        )
+        _catalogs[key] = (now, catalog)
+
+    return catalog
+
+
+def invalidate_status_catalog():
+    """Drops every cached catalog. Call after inserting/updating status rows."""
+    _catalogs.clear()
@@ -8,6 +8,7 @@ from app.utils import (
     markdown_filter,
     highlight_filter,
     local_time_filter,
+    now_context,
     time_ago_filter,
 )
 
@@ -18,6 +19,12 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     DATABASE_URL: str = "sqlite:///./tracker.db"
 
+    # Connection pool (ignored for SQLite, which uses SQLAlchemy's defaults)
+    POOL_SIZE: int = 20
+    POOL_MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: int = 30
+    POOL_RECYCLE: int = 1800
+
     APP_PORT: int
     APP_ENV: str
 
@@ -41,12 +48,27 @@ settings = get_settings()
 
 # Global Jinja2 Template Environment
 # We configured it here so it can be imported anywhere
-templates = Jinja2Templates(directory=settings.TEMPLATE_DIR)
-
-# Register filters
-templates.env.filters["days_until"] = days_until
-templates.env.filters["days_since"] = days_since
-templates.env.filters["markdown"] = markdown_filter
-templates.env.filters["highlight"] = highlight_filter
-templates.env.filters["local"] = local_time_filter
-templates.env.filters["time_ago"] = time_ago_filter
+templates = Jinja2Templates(
+    directory=settings.TEMPLATE_DIR, context_processors=[now_context]
+)
+
+
+def register_filters(env):
+    """Registers the custom filters once per Jinja environment."""
+    if getattr(env, "_filters_registered", False):
+        return
+
+    env.filters.update(
+        {
+            "days_until": days_until,
+            "days_since": days_since,
+            "markdown": markdown_filter,
+            "highlight": highlight_filter,
+            "local": local_time_filter,
+            "time_ago": time_ago_filter,
+        }
+    )
+    env._filters_registered = True
+
+
+register_filters(templates.env)
@@ -1,18 +1,58 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, raiseload
 from app.core.config import settings
 
-connect_args = {"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
+# DATABASE_URL stays a plain sync URL (alembic uses it as-is);
+# the app swaps in the matching async driver.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
 
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_async_url(database_url: str):
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    return url.set(drivername=driver) if driver else url
+
+
+def get_engine_options(url) -> dict:
+    # SQLite already gets a suitable pool (StaticPool for :memory:, a queue
+    # pool for files), and a local file has no connection to go stale.
+    if url.get_backend_name() == "sqlite":
+        return {}
+
+    return {
+        "pool_size": settings.POOL_SIZE,
+        "max_overflow": settings.POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.POOL_TIMEOUT,
+        "pool_recycle": settings.POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+database_url = get_async_url(settings.DATABASE_URL)
+engine = create_async_engine(database_url, **get_engine_options(database_url))
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+# Resolved once at import: dev_options() runs for every router query
+_DEV_OPTIONS = (raiseload("*"),) if settings.APP_ENV.lower() == "dev" else ()
+
+
+def dev_options() -> tuple:
+    """
+    Extra loader options for router queries.
+    In dev, any relationship that wasn't eager-loaded raises on access,
+    so a missing selectinload shows up as an error instead of an N+1.
+    """
+    return _DEV_OPTIONS
+
+
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from typing import Optional
+
+
+def encode_cursor(keys: list) -> str:
+    """Opaque, URL-safe token for the position after the last row of a page."""
+    raw = json.dumps(keys, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[list]:
+    """
+    Inverse of encode_cursor(). Returns None for a missing or malformed
+    token, so a tampered link just falls back to offset paging.
+    """
+    if not cursor:
+        return None
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        return None
+    return keys if isinstance(keys, list) and keys else None
@@ -0,0 +1,70 @@
+from functools import reduce
+from typing import List
+from sqlalchemy import func, literal_column, or_, text
+
+# Text search configuration used by the PostgreSQL tsvector indexes
+TS_CONFIG = literal_column("'english'")
+
+
+def fts5_match_query(words: list[str]) -> str:
+    """
+    Builds an FTS5 MATCH expression: any word, matched as a token prefix.
+    Each word is quoted so FTS5 syntax characters are taken literally.
+    """
+    return " OR ".join('"{}"*'.format(w.replace('"', '""')) for w in words)
+
+
+def fts5_rowids(fts_table: str, param: str, words: list[str]):
+    """SELECT of the matching rowids from an FTS5 table (usable in `.in_()`)."""
+    return text(
+        f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :{param}"
+    ).bindparams(**{param: fts5_match_query(words)})
+
+
+def pg_any_word_tsquery(words: list[str]):
+    """PostgreSQL tsquery matching any of `words` (plainto_tsquery per word, OR-ed)."""
+    return reduce(
+        lambda a, b: a.op("||")(b),
+        (func.plainto_tsquery(TS_CONFIG, w) for w in words),
+    )
+
+
+def build_search_condition(
+    dialect: str,
+    words: List[str],
+    model,
+    activity_model,
+    fts_table: str,
+    activity_fts_table: str,
+    tsvector,
+    activity_tsvector,
+):
+    """
+    Matches rows of `model` (Bug, Task) where ANY word appears in the title,
+    description or an activity log. Uses the full-text index of the backend:
+    FTS5 tables on SQLite, tsvector GIN indexes on PostgreSQL,
+    plain ILIKE substring matching elsewhere.
+    """
+    if dialect == "sqlite":
+        row_match = model.id.in_(fts5_rowids(fts_table, "search_q", words))
+        activity_match = activity_model.id.in_(
+            fts5_rowids(activity_fts_table, "activity_q", words)
+        )
+    elif dialect == "postgresql":
+        tsquery = pg_any_word_tsquery(words)
+        row_match = tsvector.op("@@")(tsquery)
+        activity_match = activity_tsvector.op("@@")(tsquery)
+    else:
+        row_match = or_(
+            *(
+                or_(model.title.ilike(f"%{w}%"), model.description.ilike(f"%{w}%"))
+                for w in words
+            )
+        )
+        activity_match = or_(
+            *(activity_model.content.ilike(f"%{w}%") for w in words)
+        )
+
+    # Activity matches are a correlated EXISTS (a semi-join) instead of a
+    # join, so a row with several matching logs is returned once, no DISTINCT
+    return or_(row_match, model.activities.any(activity_match))
@@ -0,0 +1,39 @@
+from slugify import slugify
+
+
+def _with_slugs(definitions):
+    return tuple({**d, "slug": slugify(d["name"])} for d in definitions)
+
+
+# --- 1. BUG STATUSES ---
+# Define the list based on your requirements
+# Format: (Name, Color, is_final)
+BUG_STATUSES = _with_slugs(
+    [
+        {"name": "Open", "color": "red", "is_final": False},
+        {"name": "Reopened", "color": "orange", "is_final": False},
+        {"name": "On Dev", "color": "blue", "is_final": False},
+        {"name": "Query Sent", "color": "indigo", "is_final": False},
+        {"name": "Query Answered", "color": "violet", "is_final": False},
+        {"name": "On QA", "color": "yellow", "is_final": False},
+        # Final States
+        {"name": "On UAT", "color": "cyan", "is_final": True},
+        {"name": "On Prod", "color": "emerald", "is_final": True},
+        {"name": "Resolved", "color": "teal", "is_final": True},
+        {"name": "Closed", "color": "green", "is_final": True},
+        {"name": "On HOLD", "color": "gray", "is_final": True},
+        {"name": "Resolved Duplicate", "color": "zinc", "is_final": True},
+    ]
+)
+
+# --- 2. TASK STATUSES ---
+TASK_STATUSES = _with_slugs(
+    [
+        {"name": "Open", "color": "blue", "is_final": False},
+        {"name": "In Progress", "color": "yellow", "is_final": False},
+        {"name": "Reopened", "color": "purple", "is_final": False},
+        # Final States
+        {"name": "Closed", "color": "green", "is_final": True},
+        {"name": "Discarded", "color": "slate", "is_final": True},
+    ]
+)
@@ -1,81 +1,53 @@
 import uvicorn
-from slugify import slugify
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.core.config import settings
 from app.core.database import SessionLocal
+from app.core.catalog import invalidate_status_catalog
+from app.core.seed_data import BUG_STATUSES, TASK_STATUSES
 from app.routers import home, bugs, tasks
 from app.models import bug, task
 
 from contextlib import asynccontextmanager
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+async def _upsert_statuses(db, status_model, definitions):
+    """
+    Inserts all status definitions in one statement.
+    Existing rows (matched by slug) get their flags/colors refreshed.
+    """
+    insert = _UPSERT_INSERTS[db.bind.dialect.name]
+    stmt = insert(status_model).values(list(definitions))
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["slug"],
+            set_={"is_final": stmt.excluded.is_final, "color": stmt.excluded.color},
+        )
+    )
 
-def seed_data():
+
+async def seed_data():
     db = SessionLocal()
 
-    # --- 1. BUG STATUSES ---
-    # Define the list based on your requirements
-    # Format: (Name, Color, is_final)
-    bug_definitions = [
-        {"name": "Open", "color": "red", "is_final": False},
-        {"name": "Reopened", "color": "orange", "is_final": False},
-        {"name": "On Dev", "color": "blue", "is_final": False},
-        {"name": "Query Sent", "color": "indigo", "is_final": False},
-        {"name": "Query Answered", "color": "violet", "is_final": False},
-        {"name": "On QA", "color": "yellow", "is_final": False},
-        # Final States
-        {"name": "On UAT", "color": "cyan", "is_final": True},
-        {"name": "On Prod", "color": "emerald", "is_final": True},
-        {"name": "Resolved", "color": "teal", "is_final": True},
-        {"name": "Closed", "color": "green", "is_final": True},
-        {"name": "On HOLD", "color": "gray", "is_final": True},
-        {"name": "Resolved Duplicate", "color": "zinc", "is_final": True},
-    ]
-
-    for s in bug_definitions:
-        slug = slugify(s["name"])
-        # Check if status exists by slug to prevent duplicates
-        existing = db.query(bug.BugStatus).filter(bug.BugStatus.slug == slug).first()
-
-        if not existing:
-            s["slug"] = slug
-            db.add(bug.BugStatus(**s))
-        else:
-            # Optional: Update existing flags/colors if they changed
-            existing.is_final = s["is_final"]
-            existing.color = s["color"]
-
-    # --- 2. TASK STATUSES ---
-    task_definitions = [
-        {"name": "Open", "color": "blue", "is_final": False},
-        {"name": "In Progress", "color": "yellow", "is_final": False},
-        {"name": "Reopened", "color": "purple", "is_final": False},
-        # Final States
-        {"name": "Closed", "color": "green", "is_final": True},
-        {"name": "Discarded", "color": "slate", "is_final": True},
-    ]
-
-    for s in task_definitions:
-        slug = slugify(s["name"])
-        existing = (
-            db.query(task.TaskStatus).filter(task.TaskStatus.slug == slug).first()
-        )
+    await _upsert_statuses(db, bug.BugStatus, BUG_STATUSES)
+    await _upsert_statuses(db, task.TaskStatus, TASK_STATUSES)
 
-        if not existing:
-            s["slug"] = slug
-            db.add(task.TaskStatus(**s))
-        else:
-            existing.is_final = s["is_final"]
-            existing.color = s["color"]
+    await db.commit()
+    await db.close()
 
-    db.commit()
-    db.close()
+    # Statuses may have changed; drop any catalog cached by this process
+    invalidate_status_catalog()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    seed_data()
+    await seed_data()
     yield
 
 
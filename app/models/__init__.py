@@ -1,4 +1,4 @@
-from .task import Task, TaskActivity, TaskHistory, TaskLink, TaskStatus
+from .task import Task, TaskActivity, TaskHistory, TaskLink, TaskStatus, TaskStatusCount
 from .bug import BugStatus, BugLink, Bug, BugActivity, BugHistory
 
 
@@ -8,6 +8,7 @@ __all__ = [
     "TaskHistory",
     "TaskLink",
     "TaskStatus",
+    "TaskStatusCount",
     "BugStatus",
     "BugLink",
     "Bug",
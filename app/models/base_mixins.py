@@ -1,7 +1,8 @@
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column
 from sqlalchemy.sql import func
+from app.models.types import UTCDateTime
 
 
 class TimestampMixin:
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(UTCDateTime(), server_default=func.now())
+    updated_at = Column(UTCDateTime(), onupdate=func.now())
@@ -4,13 +4,14 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
-    DateTime,
     ForeignKey,
     Boolean,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 from app.models.base_mixins import TimestampMixin
+from app.models.types import UTCDateTime
 
 
 __all__ = ["BugStatus", "Bug", "BugLink", "BugActivity", "BugHistory"]
@@ -37,9 +38,9 @@ class Bug(Base, TimestampMixin):
     slug = Column(String, unique=True, index=True, nullable=False)
     description = Column(Text)
     status_id = Column(Integer, ForeignKey("bug_statuses.id"))
-    delivery_date = Column(DateTime(timezone=True), nullable=True)
+    delivery_date = Column(UTCDateTime(), nullable=True)
 
-    reported_at = Column(DateTime(timezone=True), server_default=func.now())
+    reported_at = Column(UTCDateTime(), server_default=func.now())
 
     status = relationship("BugStatus", back_populates="bugs")
     links = relationship("BugLink", back_populates="bug", cascade="all, delete-orphan")
@@ -51,7 +52,10 @@ class Bug(Base, TimestampMixin):
     )
 
     history = relationship(
-        "BugHistory", back_populates="bug", cascade="all, delete-orphan"
+        "BugHistory",
+        back_populates="bug",
+        cascade="all, delete-orphan",
+        order_by="desc(BugHistory.created_at)",
     )
 
 
@@ -81,3 +85,13 @@ class BugHistory(Base, TimestampMixin):
     new_value = Column(String, nullable=True)
     remark = Column(Text, nullable=True)
     bug = relationship("Bug", back_populates="history")
+
+
+# Composite indexes: list/dashboard filter on status and sort by date,
+# activity loads filter by bug and sort newest first
+Index("ix_bugs_status_id_delivery_date", Bug.status_id, Bug.delivery_date)
+Index(
+    "ix_bug_activities_bug_id_created_at",
+    BugActivity.bug_id,
+    BugActivity.created_at.desc(),
+)
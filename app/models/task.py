@@ -1,9 +1,41 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    ForeignKey,
+    Boolean,
+    Index,
+    false,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 from app.models.base_mixins import TimestampMixin
+from app.models.types import UTCDateTime
 
-__all__ = ["TaskStatus", "Task", "TaskLink", "TaskActivity", "TaskHistory"]
+__all__ = [
+    "TaskStatus",
+    "TaskStatusCount",
+    "Task",
+    "TaskLink",
+    "TaskActivity",
+    "TaskHistory",
+    "deadline_sort_key",
+]
+
+
+# Sort value that places tasks without a deadline after every dated one.
+# A literal rather than a bound parameter: the list's ORDER BY has to render
+# the exact expression of the list index below for the planner to use it.
+NO_DEADLINE = literal_column("'9999-12-31 00:00:00+00:00'")
+
+
+def deadline_sort_key(task):
+    """Non-null deadline of `task` (Task or an alias of it) for the list order."""
+    return func.coalesce(task.deadline, NO_DEADLINE)
 
 
 class TaskStatus(Base):
@@ -17,13 +49,25 @@ class TaskStatus(Base):
     tasks = relationship("Task", back_populates="status")
 
 
+class TaskStatusCount(Base):
+    """Tasks per status, maintained by DB triggers on tasks (see migration)"""
+
+    __tablename__ = "task_status_counts"
+    status_id = Column(Integer, ForeignKey("task_statuses.id"), primary_key=True)
+    task_count = Column(Integer, nullable=False, server_default="0")
+
+
 class Task(Base, TimestampMixin):
     __tablename__ = "tasks"
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
+    # CITEXT on PostgreSQL so the unique index serves case-insensitive lookups
     slug = Column(
-        String, unique=True, index=True, nullable=False
+        String().with_variant(CITEXT(), "postgresql"),
+        unique=True,
+        index=True,
+        nullable=False,
     )  # Ensure this exists from previous step
 
     description = Column(Text, nullable=True)
@@ -32,7 +76,11 @@ class Task(Base, TimestampMixin):
     status_id = Column(Integer, ForeignKey("task_statuses.id"))
 
     # Added: For sorting "Late" items
-    deadline = Column(DateTime(timezone=True), nullable=True)
+    deadline = Column(UTCDateTime(), nullable=True)
+
+    # Copy of status.is_final kept in sync by DB triggers (see migration),
+    # so the list can sort on a plain column instead of a join + CASE
+    status_is_final = Column(Boolean, nullable=False, server_default=false())
 
     # Relationships
     status = relationship("TaskStatus", back_populates="tasks")
@@ -88,3 +136,36 @@ class TaskHistory(Base, TimestampMixin):
     remark = Column(Text, nullable=True)
 
     task = relationship("Task", back_populates="history")
+
+
+# Composite index: the dashboard filters on status and a deadline range, then
+# sorts by deadline. On PostgreSQL it also covers the other columns it reads,
+# so those rows can be read from the index alone.
+Index(
+    "ix_tasks_list_order",
+    Task.status_id,
+    Task.deadline,
+    Task.created_at,
+    postgresql_include=["id", "title", "slug", "updated_at"],
+)
+# Task list order: active before final, then by deadline and creation.
+# Same expressions as the list's ORDER BY, so pages are read in index order.
+Index(
+    "ix_tasks_status_is_final_deadline",
+    Task.status_is_final,
+    deadline_sort_key(Task),
+    Task.created_at,
+    Task.id,
+)
+
+# Activity/history loads filter by task and sort newest first
+Index(
+    "ix_task_activities_task_id_created_at",
+    TaskActivity.task_id,
+    TaskActivity.created_at.desc(),
+)
+Index(
+    "ix_task_history_task_id_created_at",
+    TaskHistory.task_id,
+    TaskHistory.created_at.desc(),
+)
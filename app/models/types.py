@@ -0,0 +1,29 @@
+from datetime import timezone
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    DateTime(timezone=True) that always returns aware UTC datetimes.
+    SQLite drops the offset and hands back naive values that are already
+    UTC (CURRENT_TIMESTAMP, or converted on the way in), so they only need
+    tzinfo attached. Naive values bound from Python are taken as UTC too.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
@@ -1,19 +1,34 @@
 import math
+from dataclasses import replace
 from fastapi import APIRouter, Depends, Request, Form, Query
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, load_only, selectinload
+from sqlalchemy import func, case, and_, select, insert, literal_column
 
 from typing import List, Optional
 from datetime import datetime, timezone
+from urllib.parse import urlencode
 
-from app.core.database import get_db
+from app.core.database import get_db, dev_options
 from app.core.config import templates
+from app.core.catalog import get_status_catalog
+from app.core.search import build_search_condition
 from app.models.bug import Bug, BugStatus, BugHistory, BugActivity, BugLink
 from app.utils import get_unique_slug
 
 router = APIRouter()
 
+# Must stay identical to the GIN index expressions (PostgreSQL) in the migration
+BUG_TSVECTOR = literal_column(
+    "to_tsvector('english', "
+    "coalesce(bugs.title, '') || ' ' || coalesce(bugs.description, ''))"
+)
+BUG_ACTIVITY_TSVECTOR = literal_column(
+    "to_tsvector('english', coalesce(bug_activities.content, ''))"
+)
+
+
 
 @router.get("/")
 async def list_bugs(
@@ -24,68 +39,81 @@ async def list_bugs(
     view: str = Query("list", enum=["list", "table"]),
     page: int = 1,
     limit: int = 10,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    # 1. Status Counts
-    status_counts = (
-        db.query(BugStatus.slug, func.count(Bug.id))
-        .join(Bug)
-        .group_by(BugStatus.slug)
-        .all()
+    # 1. Status Counts (statuses themselves come from the cached catalog)
+    count_map = dict(
+        (
+            await db.execute(
+                select(Bug.status_id, func.count(Bug.id)).group_by(Bug.status_id)
+            )
+        ).all()
     )
 
-    # Map: {'in-progress': 5, 'to-do': 2}
-    count_map = {s_slug: count for s_slug, count in status_counts}
-
-    all_statuses = db.query(BugStatus).order_by(BugStatus.id).all()
-    total_bugs_count = 0
-    for s in all_statuses:
-        s.count = count_map.get(s.slug, 0)
-        total_bugs_count += s.count
-
-    # 2. Build Query (Outerjoin Activity for Search)
-    query = db.query(Bug).outerjoin(BugActivity).join(BugStatus)
+    # Copies carry the per-request count; the cached entries stay untouched
+    all_statuses = [
+        replace(s, count=count_map.get(s.id, 0))
+        for s in await get_status_catalog(db, BugStatus)
+    ]
+    total_bugs_count = sum(s.count for s in all_statuses)
+
+    # 2. Build Query (status comes from the join, not a lazy load per row;
+    # activities are preloaded because the template reads the latest log).
+    # Only the columns the list renders are loaded, skipping the description.
+    query = (
+        select(Bug)
+        .join(BugStatus)
+        .options(
+            load_only(
+                Bug.id,
+                Bug.title,
+                Bug.slug,
+                Bug.status_id,
+                Bug.delivery_date,
+                Bug.reported_at,
+            ),
+            contains_eager(Bug.status).load_only(
+                BugStatus.name, BugStatus.slug, BugStatus.color, BugStatus.is_final
+            ),
+            selectinload(Bug.activities).load_only(
+                BugActivity.content, BugActivity.created_at
+            ),
+            *dev_options(),
+        )
+    )
 
     # --- SEARCH LOGIC (Word-by-Word OR) ---
     if search:
         search_words = search.strip().split()
-        conditions = []
-
-        for word in search_words:
-            term = f"%{word}%"
-            # Match Title OR Description OR Activity Content
-            conditions.append(
-                or_(
-                    Bug.title.ilike(term),
-                    Bug.description.ilike(term),
-                    BugActivity.content.ilike(term),
+        if search_words:
+            query = query.where(
+                build_search_condition(
+                    db.bind.dialect.name,
+                    search_words,
+                    Bug,
+                    BugActivity,
+                    "bugs_fts",
+                    "bug_activities_fts",
+                    BUG_TSVECTOR,
+                    BUG_ACTIVITY_TSVECTOR,
                 )
             )
-
-        if conditions:
-            query = query.filter(or_(*conditions))
-
-        query = query.distinct()
     # --------------------------------------
 
     # 3. Status Filtering
     if status:
-        # JOIN is already done above (.join(TaskStatus))
-        query = query.filter(BugStatus.slug.in_(status))
-
-        if not search:
-            # Calculate total from the map based on selected slugs
-            total_items = sum(count_map.get(slug, 0) for slug in status)
-        else:
-            total_items = query.count()
-    else:
-        total_items = query.count() if search else total_bugs_count
+        # JOIN is already done above (.join(BugStatus))
+        query = query.where(BugStatus.slug.in_(status))
 
     if no_date:
-        query = query.filter(Bug.delivery_date.is_(None))
-
-    if status or search or no_date:
-        total_items = query.count()
+        query = query.where(Bug.delivery_date.is_(None))
+
+    if search or no_date:
+        # Counted together with the page rows below (window aggregate)
+        total_items = None
+    elif status:
+        # Calculate total from the status counts based on selected slugs
+        total_items = sum(s.count for s in all_statuses if s.slug in status)
     else:
         total_items = total_bugs_count
 
@@ -105,17 +133,37 @@ async def list_bugs(
     )
 
     # 5. Pagination
-    total_pages = math.ceil(total_items / limit) if limit > 0 else 1
     offset = (page - 1) * limit
-    bugs = query.limit(limit).offset(offset).all()
+    page_query = query.limit(limit).offset(offset)
+
+    if total_items is None:
+        # COUNT(*) OVER () is evaluated before LIMIT, so every row carries
+        # the size of the whole filtered set
+        rows = (await db.execute(page_query.add_columns(func.count().over()))).all()
+        bugs = [bug for bug, _ in rows]
+
+        if rows:
+            total_items = rows[0][1]
+        elif offset:
+            # Past the last page: no row to read the total from
+            total_items = await db.scalar(
+                select(func.count()).select_from(query.subquery())
+            )
+        else:
+            total_items = 0
+    else:
+        bugs = (await db.scalars(page_query)).all()
 
-    # Params Helper
-    params_str = "".join([f"&status={s}" for s in status])
+    total_pages = math.ceil(total_items / limit) if limit > 0 else 1
+
+    # Params Helper (urlencode escapes search text / slugs containing & or spaces)
+    params = [("status", s) for s in status]
     if search:
-        params_str += f"&search={search}"
+        params.append(("search", search))
     if no_date:
-        params_str += "&no_date=true"
-    params_str += f"&view={view}"
+        params.append(("no_date", "true"))
+    params.append(("view", view))
+    params_str = "&" + urlencode(params)
 
     return templates.TemplateResponse(
         "bugs/list.html",
@@ -142,8 +190,8 @@ async def list_bugs(
 
 
 @router.get("/new")
-async def new_bug_form(request: Request, db: Session = Depends(get_db)):
-    statuses = db.query(BugStatus).all()
+async def new_bug_form(request: Request, db: AsyncSession = Depends(get_db)):
+    statuses = await get_status_catalog(db, BugStatus)
     return templates.TemplateResponse(
         "bugs/create.html", {"request": request, "statuses": statuses}
     )
@@ -158,21 +206,19 @@ async def create_bug(
     reported_at: str = Form(None),  # <--- New Param (datetime-local string)
     link_names: List[str] = Form([]),
     link_urls: List[str] = Form([]),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     # Parse dates
-    d_date = datetime.strptime(delivery_date, "%Y-%m-%d") if delivery_date else None
+    d_date = datetime.fromisoformat(delivery_date) if delivery_date else None
 
     # Parse Reported At (Format from HTML datetime-local is YYYY-MM-DDTHH:MM)
     r_date = None
     if reported_at:
-        r_date = datetime.strptime(reported_at, "%Y-%m-%dT%H:%M").astimezone(
-            tz=timezone.utc
-        )
+        r_date = datetime.fromisoformat(reported_at).astimezone(tz=timezone.utc)
     else:
         r_date = datetime.now(tz=timezone.utc)  # Default to now if empty
 
-    slug = get_unique_slug(db, Bug, title)
+    slug = await get_unique_slug(db, Bug, title)
     new_bug = Bug(
         title=title,
         slug=slug,
@@ -182,34 +228,52 @@ async def create_bug(
         reported_at=r_date,  # <--- Save it
     )
     db.add(new_bug)
-    db.flush()
+    await db.flush()
 
-    # Add Links
-    for name, url in zip(link_names, link_urls):
-        if url.strip():
-            db.add(BugLink(bug_id=new_bug.id, name=name, url=url))
+    # Add Links (one executemany INSERT instead of a unit-of-work row per link)
+    links = [
+        {"bug_id": new_bug.id, "name": name, "url": url}
+        for name, url in zip(link_names, link_urls)
+        if url.strip()
+    ]
+    if links:
+        await db.execute(insert(BugLink), links)
 
     # Initial Log
     # We use the reported date for the initial log timestamp too, to keep history clean
     db.add(BugActivity(bug_id=new_bug.id, content="Bug Created", created_at=r_date))
 
-    db.commit()
+    await db.commit()
     return RedirectResponse(url="/bugs", status_code=303)
 
 
 @router.get("/{slug}")
-async def bug_detail(request: Request, slug: str, db: Session = Depends(get_db)):
-    # Changed: Query by slug
-    bug = db.query(Bug).filter(Bug.slug == slug).first()
+async def bug_detail(request: Request, slug: str, db: AsyncSession = Depends(get_db)):
+    # Changed: Query by slug (everything the template touches is preloaded;
+    # status rides along on the join instead of its own SELECT)
+    bug = (
+        await db.scalars(
+            select(Bug)
+            .join(Bug.status)
+            .options(
+                contains_eager(Bug.status),
+                selectinload(Bug.links),
+                selectinload(Bug.history),
+                selectinload(Bug.activities),
+                *dev_options(),
+            )
+            .where(Bug.slug == slug)
+        )
+    ).first()
 
     if not bug:
         return RedirectResponse(url="/bugs")
 
-    statuses = db.query(BugStatus).all()
+    statuses = await get_status_catalog(db, BugStatus)
 
-    # Sort logs
-    history_logs = sorted(bug.history, key=lambda x: x.created_at, reverse=True)
-    activity_logs = sorted(bug.activities, key=lambda x: x.created_at, reverse=True)
+    # Both relationships are already ordered newest first by the DB
+    history_logs = bug.history
+    activity_logs = bug.activities
 
     return templates.TemplateResponse(
         "bugs/detail.html",
@@ -228,9 +292,9 @@ async def edit_bug_details(
     bug_id: int,
     title: str = Form(...),
     description: str = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    bug = db.query(Bug).get(bug_id)
+    bug = await db.get(Bug, bug_id)
     if not bug:
         return RedirectResponse(url="/bugs", status_code=303)
 
@@ -243,7 +307,7 @@ async def edit_bug_details(
         BugActivity(bug_id=bug.id, content="Updated bug details (Title/Description)")
     )
 
-    db.commit()
+    await db.commit()
     # Redirect to slug
     return RedirectResponse(url=f"/bugs/{bug.slug}", status_code=303)
 
@@ -254,16 +318,14 @@ async def update_bug(
     status_id: int = Form(...),
     delivery_date: str = Form(None),
     remark: str = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    bug = db.query(Bug).get(bug_id)
+    bug = await db.get(Bug, bug_id)
 
     # 1. Date Logic
-    new_date = datetime.strptime(delivery_date, "%Y-%m-%d") if delivery_date else None
-    old_date_str = (
-        bug.delivery_date.strftime("%Y-%m-%d") if bug.delivery_date else "None"
-    )
-    new_date_str = new_date.strftime("%Y-%m-%d") if new_date else "None"
+    new_date = datetime.fromisoformat(delivery_date) if delivery_date else None
+    old_date_str = bug.delivery_date.date().isoformat() if bug.delivery_date else "None"
+    new_date_str = new_date.date().isoformat() if new_date else "None"
 
     if old_date_str != new_date_str:
         db.add(
@@ -279,31 +341,40 @@ async def update_bug(
 
     # 2. Status Logic
     if bug.status_id != status_id:
-        old_status = db.query(BugStatus).get(bug.status_id)
-        new_status = db.query(BugStatus).get(status_id)
+        # Resolve both names in one round-trip
+        names = dict(
+            (
+                await db.execute(
+                    select(BugStatus.id, BugStatus.name).where(
+                        BugStatus.id.in_({bug.status_id, status_id})
+                    )
+                )
+            ).all()
+        )
         db.add(
             BugHistory(
                 bug_id=bug.id,
                 change_type="STATUS",
-                old_value=old_status.name if old_status else "?",
-                new_value=new_status.name,
+                old_value=names.get(bug.status_id, "?"),
+                new_value=names[status_id],
                 remark=remark,
             )
         )
         bug.status_id = status_id
 
-    db.commit()
+    await db.commit()
     return RedirectResponse(url=f"/bugs/{bug.slug}", status_code=303)
 
 
 @router.post("/{bug_id}/comment")
 async def add_comment(
-    bug_id: int, content: str = Form(...), db: Session = Depends(get_db)
+    bug_id: int, content: str = Form(...), db: AsyncSession = Depends(get_db)
 ):
-    bug = db.query(Bug).get(bug_id)
+    # Only the slug is needed for the redirect
+    bug_slug = (await db.execute(select(Bug.slug).where(Bug.id == bug_id))).scalar_one()
     db.add(BugActivity(bug_id=bug_id, content=content))
-    db.commit()
-    return RedirectResponse(url=f"/bugs/{bug.slug}", status_code=303)
+    await db.commit()
+    return RedirectResponse(url=f"/bugs/{bug_slug}", status_code=303)
 
 
 @router.post("/{bug_id}/attach")
@@ -311,15 +382,15 @@ async def attach_link(
     bug_id: int,
     name: str = Form(...),
     url: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Adds a new link attachment to an existing bug
     """
-    bug = db.query(Bug).get(bug_id)
+    bug_slug = (await db.execute(select(Bug.slug).where(Bug.id == bug_id))).scalar_one()
     if name and url:
         link = BugLink(bug_id=bug_id, name=name, url=url)
         db.add(link)
-        db.commit()
+        await db.commit()
 
-    return RedirectResponse(url=f"/bugs/{bug.slug}", status_code=303)
+    return RedirectResponse(url=f"/bugs/{bug_slug}", status_code=303)
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Request, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from datetime import date, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, load_only, selectinload
+from sqlalchemy import func, select, and_, literal, union_all
+from datetime import date, datetime, time, timedelta
+from operator import itemgetter
 
 from app.core.config import templates
-from app.core.database import get_db
+from app.core.database import get_db, dev_options
 from app.models.task import Task, TaskStatus, TaskActivity
 from app.models.bug import Bug, BugStatus, BugActivity
 
@@ -12,98 +14,172 @@ router = APIRouter()
 
 
 @router.get("/")
-async def dashboard(request: Request, db: Session = Depends(get_db)):
+async def dashboard(request: Request, db: AsyncSession = Depends(get_db)):
     today = date.today()
-    tomorrow = today + timedelta(days=1)
 
-    # --- 1. FETCH RAW DATA ---
-    active_tasks = (
-        db.query(Task).join(TaskStatus).filter(TaskStatus.is_final == False).all()
+    # Day boundaries for comparing against the stored datetimes
+    today_start = datetime.combine(today, time.min)
+    tomorrow_start = today_start + timedelta(days=1)
+    urgent_cutoff = tomorrow_start + timedelta(days=1)  # end of tomorrow
+
+    # --- 1. KPI CALCULATIONS (aggregated in SQL) ---
+    async def get_active_stats(model, status_model, date_col):
+        return (
+            await db.execute(
+                select(
+                    func.count(model.id),
+                    func.count(model.id).filter(date_col < today_start),
+                    func.count(model.id).filter(
+                        and_(date_col >= today_start, date_col < tomorrow_start)
+                    ),
+                )
+                .join(status_model)
+                .where(status_model.is_final == False)
+            )
+        ).one()
+
+    tasks_pending, tasks_overdue, tasks_due_today = await get_active_stats(
+        Task, TaskStatus, Task.deadline
     )
-    active_bugs = (
-        db.query(Bug).join(BugStatus).filter(BugStatus.is_final == False).all()
+    bugs_open, bugs_overdue, bugs_due_today = await get_active_stats(
+        Bug, BugStatus, Bug.delivery_date
     )
 
-    # --- 2. KPI CALCULATIONS ---
     stats = {
-        "tasks_pending": len(active_tasks),
-        "bugs_open": len(active_bugs),
-        "due_today": 0,
-        "overdue": 0,
+        "tasks_pending": tasks_pending,
+        "bugs_open": bugs_open,
+        "due_today": tasks_due_today + bugs_due_today,
+        "overdue": tasks_overdue + bugs_overdue,
     }
 
+    # --- 2. FETCH URGENT ROWS (Overdue OR Due Today OR Due Tomorrow) ---
+    # Only the columns process_item reads; status comes from the join
+    urgent_tasks = (
+        await db.scalars(
+            select(Task)
+            .join(TaskStatus)
+            .options(
+                load_only(Task.id, Task.title, Task.slug, Task.deadline),
+                contains_eager(Task.status).load_only(
+                    TaskStatus.name, TaskStatus.color
+                ),
+                *dev_options(),
+            )
+            .where(TaskStatus.is_final == False, Task.deadline < urgent_cutoff)
+            .order_by(Task.deadline)
+        )
+    ).all()
+    urgent_bugs = (
+        await db.scalars(
+            select(Bug)
+            .join(BugStatus)
+            .options(
+                load_only(Bug.id, Bug.title, Bug.slug, Bug.delivery_date),
+                contains_eager(Bug.status).load_only(BugStatus.name, BugStatus.color),
+                *dev_options(),
+            )
+            .where(BugStatus.is_final == False, Bug.delivery_date < urgent_cutoff)
+            .order_by(Bug.delivery_date)
+        )
+    ).all()
+
     # --- 3. FOCUS ZONE (Urgent Items) ---
     urgent_items = []
 
     def process_item(item, type_str, date_attr):
         target_dt = getattr(item, date_attr)
-        if not target_dt:
-            return
-
         target_date = target_dt.date()
 
-        # Logic: Overdue OR Due Today OR Due Tomorrow
-        if target_date <= tomorrow:
-            label = "Upcoming"
-            color = "blue"
-
-            if target_date < today:
-                stats["overdue"] += 1
-                label = "Overdue"
-                color = "red"
-            elif target_date == today:
-                stats["due_today"] += 1
-                label = "Due Today"
-                color = "orange"
-
-            urgent_items.append(
-                {
-                    "id": item.id,
-                    "title": item.title,
-                    "type": type_str,  # 'Task' or 'Bug'
-                    "status": item.status.name,
-                    "status_color": item.status.color,
-                    "date": target_dt,
-                    "label": label,
-                    "label_color": color,
-                    # LINK FIXED: Using slug
-                    "link": f"/{'tasks' if type_str == 'Task' else 'bugs'}/{item.slug}",
-                }
-            )
+        label = "Upcoming"
+        color = "blue"
+
+        if target_date < today:
+            label = "Overdue"
+            color = "red"
+        elif target_date == today:
+            label = "Due Today"
+            color = "orange"
 
-    for t in active_tasks:
+        urgent_items.append(
+            {
+                "id": item.id,
+                "title": item.title,
+                "type": type_str,  # 'Task' or 'Bug'
+                "status": item.status.name,
+                "status_color": item.status.color,
+                "date": target_dt,
+                "label": label,
+                "label_color": color,
+                # LINK FIXED: Using slug
+                "link": f"/{'tasks' if type_str == 'Task' else 'bugs'}/{item.slug}",
+            }
+        )
+
+    for t in urgent_tasks:
         process_item(t, "Task", "deadline")
-    for b in active_bugs:
+    for b in urgent_bugs:
         process_item(b, "Bug", "delivery_date")
 
     # Sort by Date (Oldest/Most Urgent first)
-    urgent_items.sort(key=lambda x: x["date"])
+    urgent_items.sort(key=itemgetter("date"))
 
     # --- 4. CHART DATA (Status Distribution) ---
-    def get_chart_data(model, status_model):
-        results = (
-            db.query(status_model.name, status_model.color, func.count(model.id))
+    def chart_query(kind, model, status_model):
+        return (
+            select(
+                literal(kind).label("kind"),
+                status_model.name,
+                status_model.color,
+                func.count(model.id),
+            )
+            .select_from(status_model)
             .join(model)
-            .group_by(status_model.name)
-            .all()
+            .group_by(status_model.name, status_model.color)
+        )
+
+    # Both distributions in one round-trip, split by `kind` afterwards
+    chart_rows = (
+        await db.execute(
+            union_all(
+                chart_query("tasks", Task, TaskStatus),
+                chart_query("bugs", Bug, BugStatus),
+            )
         )
-        return {
-            "labels": [r[0] for r in results],
-            "colors": [r[1] for r in results],
-            "counts": [r[2] for r in results],
-        }
+    ).all()
 
-    chart_tasks = get_chart_data(Task, TaskStatus)
-    chart_bugs = get_chart_data(Bug, BugStatus)
+    chart_data = {
+        "tasks": {"labels": [], "colors": [], "counts": []},
+        "bugs": {"labels": [], "colors": [], "counts": []},
+    }
+    for kind, name, color, count in chart_rows:
+        chart_data[kind]["labels"].append(name)
+        chart_data[kind]["colors"].append(color)
+        chart_data[kind]["counts"].append(count)
 
     # --- 5. UNIFIED ACTIVITY STREAM ---
     # Fetch last 10 of each
     t_logs = (
-        db.query(TaskActivity).order_by(TaskActivity.created_at.desc()).limit(10).all()
-    )
+        await db.scalars(
+            select(TaskActivity)
+            .options(
+                selectinload(TaskActivity.task).load_only(Task.title, Task.slug),
+                *dev_options(),
+            )
+            .order_by(TaskActivity.created_at.desc())
+            .limit(10)
+        )
+    ).all()
     b_logs = (
-        db.query(BugActivity).order_by(BugActivity.created_at.desc()).limit(10).all()
-    )
+        await db.scalars(
+            select(BugActivity)
+            .options(
+                selectinload(BugActivity.bug).load_only(Bug.title, Bug.slug),
+                *dev_options(),
+            )
+            .order_by(BugActivity.created_at.desc())
+            .limit(10)
+        )
+    ).all()
 
     activities = []
     for l in t_logs:
@@ -130,7 +206,7 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
         )
 
     # Merge and Sort desc, take top 10
-    activities.sort(key=lambda x: x["time"], reverse=True)
+    activities.sort(key=itemgetter("time"), reverse=True)
     activities = activities[:10]
 
     return templates.TemplateResponse(
@@ -140,6 +216,6 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
             "stats": stats,
             "urgent_items": urgent_items,
             "activities": activities,
-            "chart_data": {"tasks": chart_tasks, "bugs": chart_bugs},
+            "chart_data": chart_data,
         },
     )
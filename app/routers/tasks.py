@@ -1,18 +1,62 @@
 from fastapi import APIRouter, Depends, Request, Form, Query
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, contains_eager, selectinload
+from sqlalchemy import select, insert, update, literal_column, tuple_
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 import math
+from dataclasses import replace
 
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db, dev_options
 from app.core.config import templates
-from app.models.task import Task, TaskStatus, TaskHistory, TaskActivity, TaskLink
+from app.core.catalog import get_status_catalog
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.search import build_search_condition
+from app.models.task import (
+    Task,
+    TaskStatus,
+    TaskStatusCount,
+    TaskHistory,
+    TaskActivity,
+    TaskLink,
+    deadline_sort_key,
+)
 from app.utils import get_unique_slug
 
 router = APIRouter()
 
+# Tasks per status_id, read from the trigger-maintained summary table so the
+# list never scans tasks for its counts (the status catalog supplies the rest)
+STATUS_COUNTS = select(TaskStatusCount.status_id, TaskStatusCount.task_count)
+
+
+def list_sort_keys(task):
+    """
+    ORDER BY keys of the task list (Active > Deadline > Created): unfinished
+    tasks first, so overdue ones lead by their past deadlines. Every key
+    ascends and id makes the tuple unique, so a page can resume after any
+    row with a single row-value comparison.
+    """
+    return (
+        task.status_is_final,
+        deadline_sort_key(task),
+        task.created_at,
+        task.id,
+    )
+
+
+# Must stay identical to the GIN index expressions (PostgreSQL) in the migration
+TASK_TSVECTOR = literal_column(
+    "to_tsvector('english', "
+    "coalesce(tasks.title, '') || ' ' || coalesce(tasks.description, ''))"
+)
+TASK_ACTIVITY_TSVECTOR = literal_column(
+    "to_tsvector('english', coalesce(task_activities.content, ''))"
+)
+
+
 
 @router.get("/")
 async def list_tasks(
@@ -22,85 +66,101 @@ async def list_tasks(
     view: str = Query("list", enum=["list", "table"]),
     page: int = 1,
     limit: int = 10,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
 ):
-    # 1. Status Counts
-    status_counts = (
-        db.query(TaskStatus.slug, func.count(Task.id))
-        .join(Task)
-        .group_by(TaskStatus.slug)
-        .all()
-    )
-
-    count_map = {s_slug: count for s_slug, count in status_counts}
-
-    all_statuses = db.query(TaskStatus).order_by(TaskStatus.id).all()
-    total_tasks_count = 0
-    for s in all_statuses:
-        s.count = count_map.get(s.slug, 0)
-        total_tasks_count += s.count
+    # 1. Status Counts: one small read of task_status_counts; the catalog
+    # supplies every status, so zero-count ones still show up.
+    # Uses its own session so it can overlap with the page query below
+    # (one AsyncSession can't run two statements at the same time).
+    async def load_statuses():
+        async with SessionLocal() as counts_db:
+            count_map = dict((await counts_db.execute(STATUS_COUNTS)).all())
+            catalog = await get_status_catalog(counts_db, TaskStatus)
+
+        # Counts go onto per-request copies; the cached entries stay untouched
+        return [replace(s, count=count_map.get(s.id, 0)) for s in catalog]
 
     # 2. Build Query
-    # Use outerjoin to include tasks without activities
-    query = db.query(Task).outerjoin(TaskActivity).join(TaskStatus)
+    # (status comes from the join; activities are preloaded for the latest log)
+    query = (
+        select(Task)
+        .join(TaskStatus)
+        .options(
+            contains_eager(Task.status),
+            selectinload(Task.activities),
+            *dev_options(),
+        )
+    )
 
-    # --- SEARCH LOGIC (Word-by-Word OR) ---
+    # --- SEARCH LOGIC (any word, via the full-text index) ---
     if search:
         search_words = search.strip().split()
-        conditions = []
-
-        for word in search_words:
-            term = f"%{word}%"
-            # Create a condition that checks this specific word against ALL fields
-            conditions.append(
-                or_(
-                    Task.title.ilike(term),
-                    Task.description.ilike(term),
-                    TaskActivity.content.ilike(term),
+        if search_words:
+            query = query.where(
+                build_search_condition(
+                    db.bind.dialect.name,
+                    search_words,
+                    Task,
+                    TaskActivity,
+                    "tasks_fts",
+                    "task_activities_fts",
+                    TASK_TSVECTOR,
+                    TASK_ACTIVITY_TSVECTOR,
                 )
             )
-
-        # Combine all word conditions with OR
-        # This means: (Match Word 1) OR (Match Word 2) OR ...
-        if conditions:
-            query = query.filter(or_(*conditions))
-
-        # Prevent duplicates if a task matches multiple words or has multiple logs
-        query = query.distinct()
     # --------------------------------------
 
     # 3. Filter by Status (Keep existing)
     if status:
         # JOIN is already done above (.join(TaskStatus))
-        query = query.filter(TaskStatus.slug.in_(status))
-
-        if not search:
-            # Calculate total from the map based on selected slugs
-            total_items = sum(count_map.get(slug, 0) for slug in status)
-        else:
-            total_items = query.count()
+        query = query.where(TaskStatus.slug.in_(status))
+
+    # 4. Sorting (Active > Deadline > Created, on denormalized columns)
+    sort_keys = list_sort_keys(Task)
+    query = query.order_by(*sort_keys)
+
+    # 5. Pagination (keyset via cursor; plain offset for Previous/direct links)
+    # The cursor only carries the last task's id: the DB recomputes that
+    # row's keys, so stored and bound datetimes are never compared.
+    after = decode_cursor(cursor)
+    if after is not None and isinstance(after[0], int):
+        last_task = aliased(Task)
+        last_keys = (
+            select(*list_sort_keys(last_task))
+            .where(last_task.id == after[0])
+            .scalar_subquery()
+        )
+        query = query.where(tuple_(*sort_keys) > last_keys)
     else:
-        total_items = query.count() if search else total_tasks_count
+        query = query.offset((page - 1) * limit)
 
-    # 4. Sorting (Overdue > Active > Created)
-    now = datetime.now()
-    is_overdue = case(
-        (and_(TaskStatus.is_final == False, Task.deadline < now), 1), else_=0
-    )
-    is_active = case((TaskStatus.is_final == False, 1), else_=0)
-
-    query = query.order_by(
-        is_overdue.desc(),
-        Task.deadline.asc(),
-        is_active.desc(),
-        Task.created_at.asc(),
-        Task.updated_at.desc(),
+    # Counts and page are independent, so both round-trips run at once.
+    # One extra row tells whether a next page exists.
+    all_statuses, page_result = await asyncio.gather(
+        load_statuses(), db.scalars(query.limit(limit + 1))
     )
+    tasks = page_result.all()
+    has_next = len(tasks) > limit
+    tasks = tasks[:limit]
+    next_cursor = encode_cursor([tasks[-1].id]) if has_next and tasks else None
+
+    # Totals are free from the status counts; a search has no cheap total,
+    # so the page just shows Next while more rows exist
+    total_tasks_count = sum(s.count for s in all_statuses)
+    if search:
+        total_items = None
+    elif status:
+        # Calculate total from the counts of the selected statuses
+        total_items = sum(s.count for s in all_statuses if s.slug in status)
+    else:
+        total_items = total_tasks_count
 
-    # 5. Pagination
-    total_pages = math.ceil(total_items / limit) if limit > 0 else 1
-    offset = (page - 1) * limit
-    tasks = query.limit(limit).offset(offset).all()
+    total_pages = (
+        math.ceil(total_items / limit)
+        if total_items is not None and limit > 0
+        else None
+    )
 
     # Helper for URL params
     params_str = "".join([f"&status={s}" for s in status])
@@ -124,7 +184,8 @@ async def list_tasks(
                 "limit": limit,
                 "total_items": total_items,
                 "total_pages": total_pages,
-                "has_next": page < total_pages,
+                "next_cursor": next_cursor,
+                "has_next": has_next,
                 "has_prev": page > 1,
             },
         },
@@ -132,8 +193,8 @@ async def list_tasks(
 
 
 @router.get("/new")
-async def new_task_form(request: Request, db: Session = Depends(get_db)):
-    statuses = db.query(TaskStatus).all()
+async def new_task_form(request: Request, db: AsyncSession = Depends(get_db)):
+    statuses = await get_status_catalog(db, TaskStatus)
     return templates.TemplateResponse(
         "tasks/create.html", {"request": request, "statuses": statuses}
     )
@@ -147,11 +208,11 @@ async def create_task(
     deadline: str = Form(None),
     link_names: List[str] = Form([]),
     link_urls: List[str] = Form([]),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    d_date = datetime.strptime(deadline, "%Y-%m-%d") if deadline else None
+    d_date = datetime.fromisoformat(deadline) if deadline else None
 
-    slug = get_unique_slug(db, Task, title)
+    slug = await get_unique_slug(db, Task, title)
     new_task = Task(
         title=title,
         slug=slug,
@@ -160,33 +221,52 @@ async def create_task(
         deadline=d_date,
     )
     db.add(new_task)
-    db.flush()
+    await db.flush()
 
-    # Links
-    for name, url in zip(link_names, link_urls):
-        if url.strip():
-            db.add(TaskLink(task_id=new_task.id, name=name, url=url))
+    # Links (one executemany INSERT instead of a unit-of-work row per link)
+    links = [
+        {"task_id": new_task.id, "name": name, "url": url}
+        for name, url in zip(link_names, link_urls)
+        if url.strip()
+    ]
+    if links:
+        await db.execute(insert(TaskLink), links)
 
     # Initial Log
     db.add(TaskActivity(task_id=new_task.id, content="Task created"))
-    db.commit()
+    await db.commit()
 
     return RedirectResponse(url="/tasks", status_code=303)
 
 
 @router.get("/{slug}")
-async def task_detail(request: Request, slug: str, db: Session = Depends(get_db)):
+async def task_detail(request: Request, slug: str, db: AsyncSession = Depends(get_db)):
     # Changed: Query by slug instead of get(id)
-    task = db.query(Task).filter(Task.slug == slug).first()
+    # (everything the template touches is preloaded; status rides along
+    # on the join, the collections come from one IN query each)
+    task = (
+        await db.scalars(
+            select(Task)
+            .join(Task.status)
+            .options(
+                contains_eager(Task.status),
+                selectinload(Task.links),
+                selectinload(Task.history),
+                selectinload(Task.activities),
+                *dev_options(),
+            )
+            .where(Task.slug == slug)
+        )
+    ).first()
 
     if not task:
         return RedirectResponse(url="/tasks")
 
-    statuses = db.query(TaskStatus).all()
+    statuses = await get_status_catalog(db, TaskStatus)
 
-    # Split Logs (Comments vs History)
-    history_logs = sorted(task.history, key=lambda x: x.created_at, reverse=True)
-    activity_logs = sorted(task.activities, key=lambda x: x.created_at, reverse=True)
+    # Both relationships are already ordered newest first by the DB
+    history_logs = task.history
+    activity_logs = task.activities
 
     return templates.TemplateResponse(
         "tasks/detail.html",
@@ -205,25 +285,29 @@ async def edit_task_details(
     task_id: int,
     title: str = Form(...),
     description: str = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    task = db.query(Task).get(task_id)
-    if not task:
+    # One UPDATE; RETURNING hands back the slug for the redirect
+    task_slug = (
+        await db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(title=title, description=description)
+            .returning(Task.slug)
+        )
+    ).scalar_one_or_none()
+    if task_slug is None:
         return RedirectResponse(url="/tasks", status_code=303)
 
-    # Update fields
-    task.title = title
-    task.description = description
-
     # Log the update (optional, but good for tracking)
     db.add(
         TaskActivity(
-            task_id=task.id, content="Updated task details (Title/Description)"
+            task_id=task_id, content="Updated task details (Title/Description)"
         )
     )
 
-    db.commit()
-    return RedirectResponse(url=f"/tasks/{task.slug}", status_code=303)
+    await db.commit()
+    return RedirectResponse(url=f"/tasks/{task_slug}", status_code=303)
 
 
 @router.post("/{task_id}/update")
@@ -232,54 +316,66 @@ async def update_task(
     status_id: int = Form(...),
     deadline: str = Form(None),
     remark: str = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    task = db.query(Task).get(task_id)
+    # Only the columns needed to diff and log the change
+    task = (
+        await db.execute(
+            select(Task.slug, Task.status_id, Task.deadline).where(Task.id == task_id)
+        )
+    ).one()
+    changes = {}
 
     # 1. Deadline Change
-    new_date = datetime.strptime(deadline, "%Y-%m-%d") if deadline else None
-    old_date_str = task.deadline.strftime("%Y-%m-%d") if task.deadline else "None"
-    new_date_str = new_date.strftime("%Y-%m-%d") if new_date else "None"
+    new_date = datetime.fromisoformat(deadline) if deadline else None
+    old_date_str = task.deadline.date().isoformat() if task.deadline else "None"
+    new_date_str = new_date.date().isoformat() if new_date else "None"
 
     if old_date_str != new_date_str:
         db.add(
             TaskHistory(
-                task_id=task.id,
+                task_id=task_id,
                 change_type="DEADLINE",
                 old_value=old_date_str,
                 new_value=new_date_str,
                 remark=remark,
             )
         )
-        task.deadline = new_date
+        changes["deadline"] = new_date
 
     # 2. Status Change
     if task.status_id != status_id:
-        old_status = db.query(TaskStatus).get(task.status_id)
-        new_status = db.query(TaskStatus).get(status_id)
+        # Names come from the cached catalog, no status query needed
+        names = {s.id: s.name for s in await get_status_catalog(db, TaskStatus)}
         db.add(
             TaskHistory(
-                task_id=task.id,
+                task_id=task_id,
                 change_type="STATUS",
-                old_value=old_status.name if old_status else "?",
-                new_value=new_status.name,
+                old_value=names.get(task.status_id, "?"),
+                new_value=names[status_id],
                 remark=remark,
             )
         )
-        task.status_id = status_id
+        changes["status_id"] = status_id
 
-    db.commit()
+    if changes:
+        await db.execute(update(Task).where(Task.id == task_id).values(**changes))
+
+    await db.commit()
     return RedirectResponse(url=f"/tasks/{task.slug}", status_code=303)
 
 
 @router.post("/{task_id}/comment")
 async def add_comment(
-    task_id: int, content: str = Form(...), db: Session = Depends(get_db)
+    task_id: int, content: str = Form(...), db: AsyncSession = Depends(get_db)
 ):
-    task = db.query(Task).get(task_id)
+    # Only the slug is needed for the redirect
+    task_slug = (
+        await db.execute(select(Task.slug).where(Task.id == task_id))
+    ).scalar_one()
     db.add(TaskActivity(task_id=task_id, content=content))
-    db.commit()
-    return RedirectResponse(url=f"/tasks/{task.slug}", status_code=303)
+    await db.commit()
+    return RedirectResponse(url=f"/tasks/{task_slug}", status_code=303)
 
 
 @router.post("/{task_id}/attach")
@@ -287,10 +383,12 @@ async def attach_link(
     task_id: int,
     name: str = Form(...),
     url: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
+    task_slug = (
+        await db.execute(select(Task.slug).where(Task.id == task_id))
+    ).scalar_one()
     if name and url:
-        task = db.query(Task).get(task_id)
         db.add(TaskLink(task_id=task_id, name=name, url=url))
-        db.commit()
-    return RedirectResponse(url=f"/tasks/{task.slug}", status_code=303)
+        await db.commit()
+    return RedirectResponse(url=f"/tasks/{task_slug}", status_code=303)
@@ -1,9 +1,12 @@
 import re
+from functools import lru_cache
 from datetime import datetime, timezone
 import markdown  # type: ignore
+from jinja2 import pass_context
 from markupsafe import Markup
 from slugify import slugify
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import DeclarativeMeta
 
 
@@ -26,38 +29,54 @@ def days_since(date_obj):
     return delta.days
 
 
+MARKDOWN_EXTENSIONS = ("fenced_code", "nl2br", "tables")
+
+
+@lru_cache(maxsize=1024)
+def _render_markdown(text):
+    """markdown.markdown is pure for a given input, so renders are shared per process."""
+    return markdown.markdown(text, extensions=list(MARKDOWN_EXTENSIONS))
+
+
 def markdown_filter(text):
     if not text:
         return ""
 
-    return markdown.markdown(text, extensions=["fenced_code", "nl2br", "tables"])
+    return _render_markdown(text)
+
+
+# Static wrapper, so re.sub can use a template instead of a callback
+HIGHLIGHT_REPLACEMENT = r'<mark class="bg-yellow-200 dark:bg-yellow-500/30 dark:text-yellow-100 rounded-sm px-0.5 font-medium">\1</mark>'
+
+
+@lru_cache(maxsize=256)
+def _highlight_pattern(search_query):
+    """Compiled (word1|word2|...) pattern for a query, or None if it has no words."""
+    # Split search query into words and remove empty strings
+    words = [w for w in search_query.strip().split() if w]
+    if not words:
+        return None
+
+    # re.escape ensures special characters like '?' don't break regex
+    pattern_str = "|".join(re.escape(w) for w in words)
+    return re.compile(f"({pattern_str})", re.IGNORECASE)
 
 
 def highlight_filter(text, search_query):
     """
     Wraps search terms in <mark> tags.
     Handles multiple words and case-insensitivity.
+    The pattern is compiled once per query, not once per rendered field.
     """
     if not text or not search_query:
         return text
 
-    # Split search query into words and remove empty strings
-    words = [w for w in search_query.strip().split() if w]
-    if not words:
+    pattern = _highlight_pattern(search_query)
+    if pattern is None:
         return text
 
-    # Create regex pattern: (word1|word2|word3)
-    # re.escape ensures special characters like '?' don't break regex
-    pattern_str = "|".join(re.escape(w) for w in words)
-    pattern = re.compile(f"({pattern_str})", re.IGNORECASE)
-
-    # Replacement function
-    def replace(match):
-        # Apply Tailwind classes for highlighting
-        return f'<mark class="bg-yellow-200 dark:bg-yellow-500/30 dark:text-yellow-100 rounded-sm px-0.5 font-medium">{match.group(0)}</mark>'
-
     # Perform replacement
-    highlighted = pattern.sub(replace, str(text))
+    highlighted = pattern.sub(HIGHLIGHT_REPLACEMENT, str(text))
 
     # Return as safe HTML so Jinja renders the tags
     return Markup(highlighted)
@@ -67,25 +86,27 @@ def local_time_filter(date_obj):
     """
     Renders a span with raw UTC data.
     JS picks this up and converts it to local time.
-    Handles naive datetimes from SQLite by appending 'Z'.
+    Model datetimes are always aware UTC (UTCDateTime), so isoformat()
+    already carries the offset.
     """
     if not date_obj:
         return ""
 
-    # SQLite returns naive datetimes. We must treat them as UTC.
-    iso_str = date_obj.isoformat()
-    if date_obj.tzinfo is None:
-        iso_str += "Z"  # Force UTC interpretation
-
     return Markup(
         f'<span class="datetime-local opacity-0 transition-opacity duration-300" '
-        f'data-utc="{iso_str}">'
+        f'data-utc="{date_obj.isoformat()}">'
         f"{date_obj.strftime('%d %b %Y, %H:%M')} UTC"  # Fallback
         f"</span>"
     )
 
 
-def time_ago_filter(date_obj):
+def now_context(request):
+    """Template context processor: one UTC 'now' shared by a whole page render."""
+    return {"now_utc": datetime.now(timezone.utc)}
+
+
+@pass_context
+def time_ago_filter(context, date_obj):
     """
     Returns a string representing how much time has passed.
     e.g. '10 sec old', '5 min old', '2 hr old', '3 days old'
@@ -93,8 +114,8 @@ def time_ago_filter(date_obj):
     if not date_obj:
         return ""
 
-    # Handle SQLite naive dates (Assume they are UTC)
-    now = datetime.utcnow()
+    # Reuse the page's 'now' instead of reading the clock per call
+    now = context.get("now_utc") or datetime.now(timezone.utc)
     diff = now - date_obj
 
     seconds = diff.total_seconds()
@@ -117,18 +138,27 @@ def time_ago_filter(date_obj):
         return f"{years} yr old"
 
 
-def get_unique_slug(db: Session, model: DeclarativeMeta, title: str) -> str:
+async def get_unique_slug(db: AsyncSession, model: DeclarativeMeta, title: str) -> str:
     """
     Generates a URL-safe slug using python-slugify.
-    Checks the database to ensure uniqueness by appending -1, -2, etc.
+    Ensures uniqueness by appending -1, -2, etc. after the highest suffix
+    already taken, found with one query instead of probing one by one.
     """
     base_slug = slugify(title)
-    slug = base_slug
-    counter = 1
-
-    # Check if slug exists in the specific model table
-    while db.query(model).filter(model.slug == slug).first():
-        slug = f"{base_slug}-{counter}"
-        counter += 1
 
-    return slug
+    # slugify only emits [a-z0-9-], so the LIKE pattern needs no escaping;
+    # the regex then drops prefix matches such as "foo-bar" for "foo"
+    taken = (
+        await db.scalars(
+            select(model.slug).where(
+                or_(model.slug == base_slug, model.slug.like(f"{base_slug}-%"))
+            )
+        )
+    ).all()
+
+    if base_slug not in taken:
+        return base_slug
+
+    suffix_re = re.compile(rf"{re.escape(base_slug)}(?:-(\d+))?")
+    suffixes = [int(m.group(1) or 0) for m in map(suffix_re.fullmatch, taken) if m]
+    return f"{base_slug}-{max(suffixes) + 1}"